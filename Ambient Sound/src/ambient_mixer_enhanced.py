@@ -3,33 +3,98 @@ from tkinter import ttk, messagebox
 import pygame.mixer
 import json
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, Optional, List
-from dataclasses import dataclass
+from functools import partial
+from typing import Dict, Optional, List, Set
+from dataclasses import dataclass, field
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Mixer buffer size in samples; smaller values underrun on ALSA/PipeWire
+MIXER_BUFFER = 1024
+
+# Delay before effect slider changes are applied to playback
+EFFECT_DEBOUNCE_MS = 150
+
+# Interval for checking background preset writes
+SAVE_POLL_MS = 50
+
+# Worker threads used to decode sound files
+DECODE_WORKERS = 4
+
+# Delay before retrying playback of a sound that is still decoding
+DECODE_RETRY_MS = 50
+
+def _dumps(obj) -> bytes:
+    """Encode obj as UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def _loads(data: bytes):
+    """Decode JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _iter_json_items(f):
+    """Yield top-level key/value pairs from a JSON file, streaming with ijson when available"""
+    if ijson is not None:
+        return ijson.kvitems(f, "", use_float=True)
+    return _loads(f.read()).items()
+
+def _list_files(directory: str) -> Set[str]:
+    """Return the case-normalized names of regular files in directory, or an empty set if it can't be read"""
+    try:
+        with os.scandir(directory or ".") as entries:
+            return {os.path.normcase(entry.name) for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+# Errors raised for malformed preset files
+JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+def _tcl_quote(text: str) -> str:
+    """Escape text for use as a single word in a Tcl script"""
+    return "".join(
+        "\\n" if ch == "\n" else "\\" + ch if ch in ' \t\\"[]{}$;' else ch
+        for ch in text
+    )
+
+@dataclass(slots=True)
 class Sound:
     filename: str
     volume: float = 1.0
     channel: Optional[pygame.mixer.Channel] = None
     is_playing: bool = False
-    effects: dict = None
+    effects: dict = field(default_factory=lambda: {
+        "reverb": 0.0,
+        "eq_low": 1.0,
+        "eq_mid": 1.0,
+        "eq_high": 1.0
+    })
     button: Optional[ttk.Button] = None
+    pygame_sound: Optional[pygame.mixer.Sound] = None
+    load_error: Optional[str] = None
+    # Set by the decode worker once pygame_sound or load_error is final
+    ready: threading.Event = field(default_factory=threading.Event)
 
-    def __post_init__(self):
-        if self.effects is None:
-            self.effects = {
-                "reverb": 0.0,
-                "eq_low": 1.0,
-                "eq_mid": 1.0,
-                "eq_high": 1.0
-            }
-
-@dataclass
+@dataclass(slots=True)
 class Preset:
     name: str
     settings: dict
@@ -44,20 +109,40 @@ class AmbientSoundMixer:
         self.root.title("Ambient Sound Mixer")
         self.root.geometry("800x600")
         
-        # Initialize pygame mixer
-        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        # pygame mixer is initialized once the window is up, not during startup
+        self._mixer_initialized = False
+        
+        # Pending effect commits and the effects each playing sound started with
+        self._effect_jobs: Dict[str, str] = {}
+        self._applied_effects: Dict[str, dict] = {}
+        
+        # Sounds whose effects dict is referenced by a preset or snapshot;
+        # it is copied before the next change instead of on every save
+        self._shared_effects: Set[str] = set()
+        
+        # Playback requests waiting for a sound to finish decoding
+        self._play_jobs: Dict[str, str] = {}
         
         # Configure sounds
         self.sounds: Dict[str, Sound] = self.initialize_sounds()
         
-        # Load sound files
-        self.load_sounds()
+        # Background preset writes report back through this queue
+        self._save_results: "queue.Queue[tuple]" = queue.Queue()
+        self._save_lock = threading.Lock()
+        self._save_seq = 0
+        self._written_seq = 0
+        
+        # Pre-encoded JSON for each preset, so saves only encode what changed
+        self._serialized_presets: Dict[str, bytes] = {}
         
         # Create and load presets
         self.presets: Dict[str, Preset] = self.load_presets()
         
         # Setup UI
         self.setup_ui()
+        
+        # Start the mixer and decode sounds in the background once the UI is idle
+        self.root.after_idle(self._start_mixer)
 
     def initialize_sounds(self) -> Dict[str, Sound]:
         sounds_dir = Path("sounds")
@@ -69,22 +154,69 @@ class AmbientSoundMixer:
             "Ocean": Sound(str(sounds_dir / "ocean.mp3"))
         }
 
+    def _start_mixer(self):
+        """Initialize the mixer ahead of the first playback"""
+        try:
+            self._ensure_mixer()
+        except Exception as e:
+            # play_sound retries and reports the error when the user presses Play
+            logger.error(f"Error initializing mixer: {e}")
+
+    def _ensure_mixer(self):
+        """Initialize pygame mixer and start loading sound files on first use"""
+        if self._mixer_initialized:
+            return
+        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=MIXER_BUFFER)
+        
+        # Give every sound its own channel so playback never has to search
+        pygame.mixer.set_num_channels(len(self.sounds))
+        for idx, sound in enumerate(self.sounds.values()):
+            sound.channel = pygame.mixer.Channel(idx)
+        
+        # Only mark the mixer ready once decoding has started, so a failure is retried
+        self.load_sounds()
+        self._mixer_initialized = True
+
     def load_sounds(self):
-        """Load sound files into pygame mixer with error handling"""
-        for sound_name, sound in self.sounds.items():
-            if not os.path.exists(sound.filename):
-                messagebox.showwarning(
-                    "File Missing",
-                    f"Sound file not found: {sound.filename}"
-                )
+        """Check sound files and decode them on a background thread"""
+        # List each sound directory once instead of stat-ing every file
+        available: Dict[str, Set[str]] = {}
+        pending: List[Sound] = []
+        for sound in self.sounds.values():
+            directory, filename = os.path.split(sound.filename)
+            if directory not in available:
+                available[directory] = _list_files(directory)
+            # Fall back to a stat on a miss so case-insensitive filesystems still match
+            if (os.path.normcase(filename) not in available[directory]
+                    and not os.path.exists(sound.filename)):
+                # Reported by play_sound, so the user sees one message per click
+                sound.load_error = f"Sound file not found: {sound.filename}"
+                sound.ready.set()
                 continue
-            try:
-                pygame.mixer.Sound(sound.filename)
-            except pygame.error as e:
-                messagebox.showerror(
-                    "Loading Error",
-                    f"Error loading {sound_name}: {str(e)}"
-                )
+            pending.append(sound)
+
+        threading.Thread(
+            target=self._decode_sounds_worker,
+            args=(pending,),
+            daemon=True
+        ).start()
+
+    def _decode_sounds_worker(self, pending: List[Sound]):
+        """Decode sound files in parallel and mark each one ready"""
+        with ThreadPoolExecutor(max_workers=DECODE_WORKERS) as executor:
+            futures = {
+                executor.submit(pygame.mixer.Sound, sound.filename): sound
+                for sound in pending
+            }
+            for future in as_completed(futures):
+                sound = futures[future]
+                try:
+                    sound.pygame_sound = future.result()
+                except Exception as e:
+                    # Any failure must still mark the sound ready, or playback retries forever
+                    sound.load_error = str(e)
+                finally:
+                    sound.ready.set()
 
     def setup_ui(self):
         """Create the user interface"""
@@ -112,6 +244,9 @@ class AmbientSoundMixer:
         controls_frame = ttk.LabelFrame(parent, text="Sound Controls", padding=10)
         controls_frame.pack(fill='x', padx=5, pady=5)
 
+        # One Tcl command shared by every volume slider; Tk appends the value
+        self._vol_cmd = self.root.register(self._tcl_volume_cb)
+
         for idx, (sound_name, sound) in enumerate(self.sounds.items()):
             frame = ttk.Frame(controls_frame)
             frame.pack(fill='x', pady=2)
@@ -127,7 +262,7 @@ class AmbientSoundMixer:
                 to=100,
                 orient=tk.HORIZONTAL,
                 variable=volume_var,
-                command=lambda v, name=sound_name: self.on_volume_change(name, float(v))
+                command=(self._vol_cmd, sound_name)
             )
             volume_slider.pack(side='left', fill='x', expand=True, padx=5)
 
@@ -136,48 +271,43 @@ class AmbientSoundMixer:
                 frame,
                 text="Play",
                 width=10,
-                command=lambda name=sound_name: self.toggle_sound(name)
+                command=partial(self.toggle_sound, sound_name)
             )
             btn.pack(side='left', padx=5)
             sound.button = btn
 
     def create_effects_controls(self, parent):
         """Create controls for audio effects"""
-        for sound_name, sound in self.sounds.items():
-            frame = ttk.LabelFrame(parent, text=f"Effects: {sound_name}", padding=10)
-            frame.pack(fill='x', padx=5, pady=5)
-
-            # Reverb control
-            ttk.Label(frame, text="Reverb:").grid(row=0, column=0, padx=5)
-            reverb_var = tk.DoubleVar(value=sound.effects["reverb"])
-            reverb_slider = ttk.Scale(
-                frame,
-                from_=0,
-                to=1,
-                orient=tk.HORIZONTAL,
-                variable=reverb_var,
-                command=lambda v, name=sound_name: self.update_effect(name, "reverb", float(v))
+        # One Tcl command shared by every effect slider; Tk appends the value
+        self._effect_cmd = self.root.register(self._tcl_effect_cb)
+
+        # EQ controls follow the reverb row
+        eq_labels = ["Low", "Mid", "High"]
+        eq_params = ["eq_low", "eq_mid", "eq_high"]
+
+        # Build every widget in a single script so Tcl is entered only once
+        script = []
+        for idx, (sound_name, sound) in enumerate(self.sounds.items()):
+            frame = f"{parent}.effects{idx}"
+            script.append(
+                f"ttk::labelframe {frame} -text {_tcl_quote(f'Effects: {sound_name}')} -padding 10\n"
+                f"pack {frame} -fill x -padx 5 -pady 5"
             )
-            reverb_slider.grid(row=0, column=1, sticky='ew', padx=5)
 
-            # EQ controls
-            eq_labels = ["Low", "Mid", "High"]
-            eq_params = ["eq_low", "eq_mid", "eq_high"]
-            
-            for i, (label, param) in enumerate(zip(eq_labels, eq_params)):
-                ttk.Label(frame, text=f"{label}:").grid(row=i+1, column=0, padx=5)
-                eq_var = tk.DoubleVar(value=sound.effects[param])
-                eq_slider = ttk.Scale(
-                    frame,
-                    from_=0,
-                    to=2,
-                    orient=tk.HORIZONTAL,
-                    variable=eq_var,
-                    command=lambda v, name=sound_name, p=param: self.update_effect(name, p, float(v))
+            rows = [("Reverb", "reverb", 1)] + [(label, param, 2) for label, param in zip(eq_labels, eq_params)]
+            for row, (label, param, to) in enumerate(rows):
+                command = f"[list {self._effect_cmd} {_tcl_quote(sound_name)} {param}]"
+                script.append(
+                    f"ttk::label {frame}.label{row} -text {_tcl_quote(label + ':')}\n"
+                    f"grid {frame}.label{row} -row {row} -column 0 -padx 5\n"
+                    f"ttk::scale {frame}.scale{row} -from 0 -to {to} -orient horizontal "
+                    f"-value {sound.effects[param]!r} -command {command}\n"
+                    f"grid {frame}.scale{row} -row {row} -column 1 -sticky ew -padx 5"
                 )
-                eq_slider.grid(row=i+1, column=1, sticky='ew', padx=5)
 
-            frame.columnconfigure(1, weight=1)
+            script.append(f"grid columnconfigure {frame} 1 -weight 1")
+
+        self.root.tk.eval("\n".join(script))
 
     def create_preset_controls(self, parent):
         """Create preset controls"""
@@ -216,10 +346,11 @@ class AmbientSoundMixer:
         ).pack(side='left', padx=5)
 
         self.preset_var = tk.StringVar()
+        self._combo_values: List[str] = list(self.presets.keys())
         self.preset_combo = ttk.Combobox(
             button_frame,
             textvariable=self.preset_var,
-            values=list(self.presets.keys())
+            values=self._combo_values
         )
         self.preset_combo.pack(side='left', padx=5)
 
@@ -232,7 +363,8 @@ class AmbientSoundMixer:
     def toggle_sound(self, sound_name: str):
         """Toggle sound playback"""
         sound = self.sounds[sound_name]
-        if sound.is_playing:
+        # A playback request waiting on decoding counts as playing so it can be cancelled
+        if sound.is_playing or sound_name in self._play_jobs:
             self.stop_sound(sound_name)
         else:
             self.play_sound(sound_name)
@@ -240,27 +372,50 @@ class AmbientSoundMixer:
     def play_sound(self, sound_name: str):
         """Play a sound"""
         try:
+            self._ensure_mixer()
             sound = self.sounds[sound_name]
-            sound_obj = pygame.mixer.Sound(sound.filename)
-            channel = pygame.mixer.find_channel()
+            if not sound.ready.is_set():
+                # Still decoding; try again shortly without blocking the UI
+                if sound_name not in self._play_jobs:
+                    self._play_jobs[sound_name] = self.root.after(
+                        DECODE_RETRY_MS, self._retry_play, sound_name
+                    )
+                    sound.button.configure(text="Stop")
+                return
             
-            if channel is None:
-                messagebox.showwarning("Warning", "No available audio channels")
+            sound_obj = sound.pygame_sound
+            if sound_obj is None:
+                sound.button.configure(text="Play")
+                if sound.load_error is not None:
+                    messagebox.showerror(
+                        "Loading Error",
+                        f"Error loading {sound_name}: {sound.load_error}"
+                    )
+                else:
+                    messagebox.showwarning("Warning", f"Sound not loaded: {sound_name}")
                 return
-                
-            channel.play(sound_obj, loops=-1)
-            channel.set_volume(sound.volume)
+            sound.channel.play(sound_obj, loops=-1)
+            sound.channel.set_volume(sound.volume)
             
-            sound.channel = channel
             sound.is_playing = True
+            self._applied_effects[sound_name] = sound.effects
+            self._shared_effects.add(sound_name)
             sound.button.configure(text="Stop")
             
         except Exception as e:
             messagebox.showerror("Playback Error", f"Error playing {sound_name}: {str(e)}")
 
+    def _retry_play(self, sound_name: str):
+        """Retry a playback request that was waiting on decoding"""
+        self._play_jobs.pop(sound_name, None)
+        self.play_sound(sound_name)
+
     def stop_sound(self, sound_name: str):
         """Stop a sound"""
         try:
+            pending = self._play_jobs.pop(sound_name, None)
+            if pending is not None:
+                self.root.after_cancel(pending)
             sound = self.sounds[sound_name]
             if sound.channel:
                 sound.channel.stop()
@@ -273,17 +428,48 @@ class AmbientSoundMixer:
     def update_effect(self, sound_name: str, effect: str, value: float):
         """Update effect settings for a sound"""
         sound = self.sounds[sound_name]
+        if sound_name in self._shared_effects:
+            sound.effects = sound.effects.copy()
+            self._shared_effects.discard(sound_name)
         sound.effects[effect] = value
         
-        if sound.is_playing:
-            # Restart the sound to apply new effects
-            self.stop_sound(sound_name)
-            self.play_sound(sound_name)
+        # Sliders fire on every pixel; only restart once dragging settles
+        pending = self._effect_jobs.pop(sound_name, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._effect_jobs[sound_name] = self.root.after(
+            EFFECT_DEBOUNCE_MS, self._commit_effects, sound_name
+        )
+
+    def _commit_effects(self, sound_name: str):
+        """Restart a playing sound if its effects changed since it started"""
+        self._effect_jobs.pop(sound_name, None)
+        sound = self.sounds[sound_name]
+        if not sound.is_playing:
+            return
+        if sound.effects == self._applied_effects.get(sound_name):
+            return
+        
+        # Restart the sound to apply new effects
+        self.stop_sound(sound_name)
+        self.play_sound(sound_name)
+
+    def _tcl_effect_cb(self, sound_name: str, effect: str, value: str):
+        """Tcl callback for effect sliders"""
+        self.update_effect(sound_name, effect, float(value))
 
-    def on_volume_change(self, sound_name: str, value: float):
+    def _tcl_volume_cb(self, sound_name: str, value: str):
+        """Tcl callback for volume sliders"""
+        self.on_volume_change(sound_name, int(float(value)))
+
+    def on_volume_change(self, sound_name: str, value: int):
         """Handle volume change for a sound"""
         sound = self.sounds[sound_name]
-        sound.volume = value / 100
+        volume = value / 100
+        # Dragging emits many events for the same integer position
+        if volume == sound.volume:
+            return
+        sound.volume = volume
         if sound.channel:
             sound.channel.set_volume(sound.volume)
 
@@ -298,24 +484,33 @@ class AmbientSoundMixer:
             sound_name: {
                 "volume": sound.volume,
                 "is_playing": sound.is_playing,
-                "effects": sound.effects.copy()
+                "effects": sound.effects
             }
             for sound_name, sound in self.sounds.items()
         }
+        self._shared_effects.update(self.sounds)
 
         tags = [tag.strip() for tag in self.tags_var.get().split(',') if tag.strip()]
         
-        self.presets[name] = Preset(
+        new_preset = Preset(
             name=name,
             settings=preset_data,
             category=self.category_var.get(),
             tags=tags,
             created_at=datetime.now().isoformat()
         )
-
-        self.save_presets_to_file()
-        self.update_preset_list()
-        messagebox.showinfo("Success", f"Preset '{name}' saved successfully")
+        self.presets[name] = new_preset
+        # Built by hand because asdict() would deep-copy the shared effects dicts
+        self._serialized_presets[name] = _dumps({
+            "name": new_preset.name,
+            "settings": new_preset.settings,
+            "category": new_preset.category,
+            "tags": new_preset.tags,
+            "created_at": new_preset.created_at
+        })
+
+        self.update_preset_list(name)
+        self.save_presets_to_file(name)
 
     def load_preset(self):
         """Load preset"""
@@ -329,7 +524,8 @@ class AmbientSoundMixer:
             if sound_name in self.sounds:
                 sound = self.sounds[sound_name]
                 sound.volume = settings["volume"]
-                sound.effects = settings["effects"].copy()
+                sound.effects = settings["effects"]
+                self._shared_effects.add(sound_name)
                 
                 if settings["is_playing"]:
                     self.play_sound(sound_name)
@@ -338,28 +534,75 @@ class AmbientSoundMixer:
 
     def load_presets(self) -> Dict[str, Preset]:
         """Load presets from file"""
+        presets: Dict[str, Preset] = {}
         try:
-            with open("presets.json", "r") as f:
-                data = json.load(f)
-                return {
-                    name: Preset(**preset_data)
-                    for name, preset_data in data.items()
-                }
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open("presets.json", "rb") as f:
+                for name, d in _iter_json_items(f):
+                    self._serialized_presets[name] = _dumps(d)
+                    presets[name] = Preset(d["name"], d["settings"], d["category"], d["tags"], d["created_at"])
+            return presets
+        except (FileNotFoundError, *JSON_ERRORS):
+            self._serialized_presets = {}
             return {}
 
-    def save_presets_to_file(self):
-        """Save presets to file"""
-        with open("presets.json", "w") as f:
-            json.dump(
-                {name: preset.__dict__ for name, preset in self.presets.items()},
-                f,
-                indent=2
-            )
+    def save_presets_to_file(self, preset_name: str):
+        """Save presets to file on a background thread"""
+        # Serialize on the UI thread so the worker gets a consistent snapshot
+        payload = b"{" + b",".join(
+            _dumps(name) + b":" + fragment
+            for name, fragment in self._serialized_presets.items()
+        ) + b"}"
+        self._save_seq += 1
+        threading.Thread(
+            target=self._write_presets_atomic,
+            args=(payload, self._save_seq, preset_name),
+            daemon=True
+        ).start()
+        self.root.after(SAVE_POLL_MS, self._poll_save_results)
+
+    def _write_presets_atomic(self, payload: bytes, seq: int, preset_name: str):
+        """Write serialized presets via a temp file and report the result"""
+        try:
+            with self._save_lock:
+                # A newer snapshot already on disk includes this preset
+                if seq > self._written_seq:
+                    try:
+                        with open("presets.json.tmp", "wb") as f:
+                            f.write(payload)
+                        os.replace("presets.json.tmp", "presets.json")
+                    except Exception:
+                        # Clean up while still holding the lock, since every save shares this path
+                        try:
+                            os.remove("presets.json.tmp")
+                        except OSError:
+                            pass
+                        raise
+                    self._written_seq = seq
+            self._save_results.put((preset_name, None))
+        except Exception as e:
+            # Always report back, or the UI would poll for this result forever
+            self._save_results.put((preset_name, e))
+
+    def _poll_save_results(self):
+        """Show the outcome of a background preset write"""
+        try:
+            preset_name, error = self._save_results.get_nowait()
+        except queue.Empty:
+            self.root.after(SAVE_POLL_MS, self._poll_save_results)
+            return
 
-    def update_preset_list(self):
-        """Update the preset selection dropdown"""
-        self.preset_combo['values'] = list(self.presets.keys())
+        if error is not None:
+            logger.error(f"Error saving preset {preset_name}: {error}")
+            messagebox.showerror("Save Error", f"Error saving preset '{preset_name}': {str(error)}")
+        else:
+            messagebox.showinfo("Success", f"Preset '{preset_name}' saved successfully")
+
+    def update_preset_list(self, preset_name: str):
+        """Add a preset to the selection dropdown if it is new"""
+        if preset_name in self._combo_values:
+            return
+        self.preset_combo['values'] = (*self._combo_values, preset_name)
+        self._combo_values.append(preset_name)
 
     def run(self):
         """Start the application"""